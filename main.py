@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from src.datagenerator import DataGenerator
@@ -94,6 +95,12 @@ def setup_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
+@lru_cache(maxsize=32)
+def _get_generator(schema_items: tuple) -> DataGenerator:
+    """Returns a DataGenerator for the schema, reusing the compiled one for repeated schemas."""
+    return DataGenerator(dict(schema_items))
+
+
 def main(args: argparse.Namespace):
     # --- Argument Validation ---
     if args.file_count < 0:
@@ -124,7 +131,12 @@ def main(args: argparse.Namespace):
         handle_clear_path(save_path, args.file_name)
 
     # --- Generation ---
-    generator = DataGenerator(data_schema)
+    try:
+        # Item order is kept in the key because it decides the column order of the output
+        generator = _get_generator(tuple(data_schema.items()))
+    except (AttributeError, TypeError):
+        # Non-dict or unhashable schemas are not cached; DataGenerator reports why they are invalid
+        generator = DataGenerator(data_schema)
     if not generator.is_valid:
         logging.critical("Exiting: The provided data schema is invalid for the generator.")
         sys.exit(1)
@@ -143,9 +155,9 @@ def main(args: argparse.Namespace):
     logging.info(
         f"Schema is valid. Proceeding to generate {total_items_to_generate} item(s) for {args.file_count} file(s)."
     )
-    results = generator.generate_data(num_data=total_items_to_generate, num_workers=args.workers)
+    # Records are streamed straight into the files instead of being collected in memory first
+    results = generator.generate_data_iter(num_data=total_items_to_generate, num_workers=args.workers)
 
-    logging.info(f"Successfully generated {total_items_to_generate} item(s). Saving to {args.file_count} file(s).")
     # --- Saving ---
     save_results_to_files(
         results,
@@ -154,6 +166,7 @@ def main(args: argparse.Namespace):
         save_path=save_path,
         file_name=args.file_name,
         prefix=args.prefix,
+        num_workers=args.workers,
     )
     sys.exit(0)
 
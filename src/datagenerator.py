@@ -1,38 +1,86 @@
 import ast
 import logging
+import os
 import random
 import re
 import time
-import uuid
+from collections import deque
+from collections.abc import Iterator
 from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 
 
+class _OptionSampler:
+    """
+    Picks random items from a fixed list of options. Draws are made in blocks
+    with Random.choices and handed out one per call, which is cheaper than a
+    Random.choice call per record.
+    """
+
+    BLOCK_SIZE = 4096
+    __slots__ = ("_options", "_rng", "_block")
+
+    def __init__(self, options: list, rng: random.Random) -> None:
+        self._options = options
+        self._rng = rng
+        self._block = []
+
+    def __getstate__(self) -> tuple:
+        # Drop pre-drawn items so every unpickled copy draws its own from the reseeded rng
+        return self._options, self._rng
+
+    def __setstate__(self, state: tuple) -> None:
+        self._options, self._rng = state
+        self._block = []
+
+    def __call__(self):
+        block = self._block
+        if not block:
+            block.extend(self._rng.choices(self._options, k=self.BLOCK_SIZE))
+        return block.pop()
+
+
 class DataGenerator:
     RAND_INT_PATTERN = re.compile(r"^rand\(\s*(-?\d+)\s*,\s*(-?\d+)\s*\)$")
-    LIST_PATTERN = re.compile(r"^\[.*\]$")
+    MAX_BATCH_SIZE = 10_000
 
     def __init__(self, data_schema: dict) -> None:
         self.possible_types = ["timestamp", "str", "int"]
         self.generation_plan = {}
+        self._rng = random.Random()  # noqa: S311
+        self._ts_snapshot = None
         self.is_valid = self._parse_and_compile_schema(data_schema)
+        self._keys = tuple(self.generation_plan.keys())
+        self._funcs = tuple(self.generation_plan.values())
+        self._fast_gen = self._compile_fast_gen()
+
+    def __getstate__(self) -> dict:
+        # The exec-generated record builder cannot be pickled; it is rebuilt in __setstate__
+        state = self.__dict__.copy()
+        del state["_fast_gen"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        # Every unpickled copy would otherwise replay the parent's random sequence
+        self._rng.seed()
+        self._fast_gen = self._compile_fast_gen()
 
     # --- Internal Helper Methods for Generation (Wrappers) ---
     def _generate_timestamp(self) -> int:
-        """Wrapper for timestamp generation."""
+        """Wrapper for timestamp generation. Reuses the batch snapshot taken by generate_data."""
+        if self._ts_snapshot is not None:
+            return self._ts_snapshot
         return int(time.time())
 
-    def _generate_rand_int(self, from_val: int, to_val: int) -> int:
-        """Wrapper for random integer generation."""
-        return random.randint(from_val, to_val)  # noqa: S311
-
-    def _generate_from_list(self, options: list):
-        """Wrapper for choosing from a list."""
-        return random.choice(options)  # noqa: S311
+    def _generate_live_timestamp(self) -> int:
+        """Wrapper for timestamp generation that reads the clock for every record."""
+        return int(time.time())
 
     def _generate_uuid(self) -> str:
-        """Wrapper for UUID generation."""
-        return str(uuid.uuid4())
+        """Wrapper for UUID-shaped random string generation (128 random bits, dashed hex)."""
+        h = os.urandom(16).hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
     def _generate_static_value(self, value):
         """Returns a pre-configured static value."""
@@ -47,12 +95,12 @@ class DataGenerator:
         return ""
 
     # --- Helper Methods for Parsing ---
-    def _compile_list_source(self, key: str, val_source: str, item_type: type) -> partial | None:
+    def _compile_list_source(self, key: str, val_source: str, item_type: type) -> _OptionSampler | None:
         """Parses and validates a list source string for a given type."""
         try:
             parsed_list = ast.literal_eval(val_source)
             if isinstance(parsed_list, list) and all(isinstance(i, item_type) for i in parsed_list):
-                return partial(self._generate_from_list, parsed_list)
+                return _OptionSampler(parsed_list, self._rng)
             else:
                 logging.error(
                     f"Validation Error for key '{key}': '{val_source}' is not a valid list of {item_type.__name__}s."
@@ -94,20 +142,22 @@ class DataGenerator:
             generator_func = None
 
             if val_type == "timestamp":
-                if val_source:
-                    logging.warning(f"For key '{key}', timestamp type ignores source value '{val_source}'.")
-                generator_func = self._generate_timestamp
+                if val_source == "live":
+                    generator_func = self._generate_live_timestamp
+                else:
+                    if val_source:
+                        logging.warning(f"For key '{key}', timestamp type ignores source value '{val_source}'.")
+                    generator_func = self._generate_timestamp
 
             elif val_type == "int":
-                rand_int_match = self.RAND_INT_PATTERN.match(val_source)
                 if not val_source:
                     generator_func = self._generate_none
                 elif val_source == "rand":
-                    generator_func = partial(self._generate_rand_int, 0, 10000)
-                elif rand_int_match:
+                    generator_func = partial(self._rng.randrange, 0, 10001)
+                elif val_source.startswith("rand(") and (rand_int_match := self.RAND_INT_PATTERN.match(val_source)):
                     from_val, to_val = map(int, rand_int_match.groups())
-                    generator_func = partial(self._generate_rand_int, min(from_val, to_val), max(from_val, to_val))
-                elif self.LIST_PATTERN.match(val_source):
+                    generator_func = partial(self._rng.randrange, min(from_val, to_val), max(from_val, to_val) + 1)
+                elif val_source[0] == "[" and val_source[-1] == "]":
                     generator_func = self._compile_list_source(key, val_source, int)
                 else:
                     generator_func = self._compile_standalone_source(key, val_source, int)
@@ -117,10 +167,10 @@ class DataGenerator:
                     generator_func = self._generate_empty_string
                 elif val_source == "rand":
                     generator_func = self._generate_uuid
-                elif self.RAND_INT_PATTERN.match(val_source):
+                elif val_source.startswith("rand(") and self.RAND_INT_PATTERN.match(val_source):
                     logging.error(f"Validation Error for key '{key}': 'rand(from, to)' is only for 'int' type.")
                     return False
-                elif self.LIST_PATTERN.match(val_source):
+                elif val_source[0] == "[" and val_source[-1] == "]":
                     generator_func = self._compile_list_source(key, val_source, str)
                 else:
                     generator_func = partial(self._generate_static_value, val_source)
@@ -132,22 +182,61 @@ class DataGenerator:
 
         return True
 
+    def _compile_fast_gen(self):
+        """
+        Builds a function that returns one record as a dict literal with every
+        generator call inlined, so generating a record does not iterate the plan.
+        """
+        arg_names = [f"f{i}" for i in range(len(self._funcs))]
+        fields = ", ".join(f"{key!r}: {arg}()" for key, arg in zip(self._keys, arg_names))
+        source = f"def _build({', '.join(arg_names)}):\n    return lambda: {{{fields}}}\n"
+        namespace = {}
+        exec(source, namespace)  # noqa: S102
+        return namespace["_build"](*self._funcs)
+
     def _generate_one_file(self, _=None) -> dict:
         """Generates a single dictionary by executing the pre-compiled plan."""
-        return {key: func() for key, func in self.generation_plan.items()}
+        return self._fast_gen()
 
-    def generate_data(self, num_data: int, num_workers: int = 1) -> list[dict]:
-        """Generates a dataset, using multiprocessing if num_workers > 1"""
+    def _generate_batch(self, count: int) -> list[dict]:
+        """Generates a list of count dictionaries; the unit of work sent to worker processes."""
+        fast_gen = self._fast_gen
+        return [fast_gen() for _ in range(count)]
+
+    def generate_data_iter(self, num_data: int, num_workers: int = 1) -> Iterator[dict]:
+        """
+        Yields a dataset record by record, using multiprocessing if num_workers > 1.
+        Only a bounded number of batches is generated ahead of the consumer.
+        """
         if not self.is_valid:
             logging.error("Cannot generate data: The DataGenerator was initialized with an invalid schema.")
-            return []
+            return
 
         logging.info(f"Generating {num_data} file(s) with {num_workers} worker(s)...")
 
-        if num_workers <= 1:
-            return [self._generate_one_file() for _ in range(num_data)]
-
-        with ProcessPoolExecutor(max_workers=num_workers) as executor:
-            results = list(executor.map(self._generate_one_file, range(num_data)))
+        # Read the clock once per call; the snapshot is pickled along with self to the workers
+        self._ts_snapshot = int(time.time())
+        try:
+            if num_workers <= 1:
+                for start in range(0, num_data, self.MAX_BATCH_SIZE):
+                    yield from self._generate_batch(min(self.MAX_BATCH_SIZE, num_data - start))
+                return
+
+            # Ship records in batches so each worker round trip pickles many records, not one
+            batch_size = min(self.MAX_BATCH_SIZE, max(1, -(-num_data // (num_workers * 4))))
+
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                pending = deque()
+                for start in range(0, num_data, batch_size):
+                    pending.append(executor.submit(self._generate_batch, min(batch_size, num_data - start)))
+                    # Keep every worker busy without running far ahead of the consumer
+                    if len(pending) > num_workers * 2:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+        finally:
+            self._ts_snapshot = None
 
-        return results
+    def generate_data(self, num_data: int, num_workers: int = 1) -> list[dict]:
+        """Generates a dataset, using multiprocessing if num_workers > 1"""
+        return list(self.generate_data_iter(num_data, num_workers))
@@ -1,8 +1,23 @@
 import json
 import logging
+import os
 import random
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from uuid import uuid4
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 
 def validate_save_path(path_str: str) -> Path | None:
@@ -34,8 +49,8 @@ def validate_save_path(path_str: str) -> Path | None:
 def read_from_path(path: Path) -> dict | None:
     """Internal function to read JSON from a file path with specific error handling."""
     try:
-        with path.open("r") as file:
-            return json.load(file)
+        with path.open("rb") as file:
+            return _json_loads(file.read())
     except FileNotFoundError:
         logging.debug(f"Path attempt failed: File not found at '{path}'.")
         return None
@@ -53,7 +68,7 @@ def read_from_path(path: Path) -> dict | None:
 def read_from_string(schema_string: str) -> dict | None:
     """Internal function to parse a JSON string."""
     try:
-        return json.loads(schema_string)
+        return _json_loads(schema_string)
     except json.JSONDecodeError:
         logging.debug("String attempt failed: Input is not a valid JSON string.")
         return None
@@ -66,15 +81,27 @@ def load_data_schema(input_str: str | None) -> dict | None:
         logging.error("Error: The data schema has not been specified.")
         return None
 
-    loaded_from_path = read_from_path(Path(input_str))
-    if loaded_from_path is not None:
-        logging.info(f"Successfully loaded schema from file path: '{input_str}'")
-        return loaded_from_path
+    # Inline JSON is tried before the filesystem, so the common case costs no stat() call
+    string_first = input_str.lstrip().startswith(("{", "["))
+    could_be_path = "\n" not in input_str
+
+    if string_first:
+        loaded_from_string = read_from_string(input_str)
+        if loaded_from_string is not None:
+            logging.info("Successfully loaded schema from raw string.")
+            return loaded_from_string
+
+    if could_be_path:
+        loaded_from_path = read_from_path(Path(input_str))
+        if loaded_from_path is not None:
+            logging.info(f"Successfully loaded schema from file path: '{input_str}'")
+            return loaded_from_path
 
-    loaded_from_string = read_from_string(input_str)
-    if loaded_from_string is not None:
-        logging.info("Successfully loaded schema from raw string.")
-        return loaded_from_string
+    if not string_first:
+        loaded_from_string = read_from_string(input_str)
+        if loaded_from_string is not None:
+            logging.info("Successfully loaded schema from raw string.")
+            return loaded_from_string
 
     logging.error("Failed to load data schema. Input is not a valid path or a valid JSON string.")
     return None
@@ -84,13 +111,17 @@ def handle_clear_path(save_path: Path, file_name: str) -> None:
     """Deletes old files in the save directory that match the base file_name."""
     logging.info(f"Clear path is on. Deleting files matching '{file_name}*.json' in '{save_path}'...")
     deleted_count = 0
-    for file_to_delete in save_path.glob(f"{file_name}*.json"):
-        try:
-            file_to_delete.unlink()
-            logging.debug(f"Deleted file: {file_to_delete}")
-            deleted_count += 1
-        except OSError as e:
-            logging.error(f"Could not delete file {file_to_delete}: {e}")
+    # scandir hands back bare names, so matching costs no Path object or stat() per entry
+    with os.scandir(save_path) as entries:
+        for entry in entries:
+            if not (entry.name.startswith(file_name) and entry.name.endswith(".json")):
+                continue
+            try:
+                os.unlink(entry.path)
+                logging.debug(f"Deleted file: {entry.path}")
+                deleted_count += 1
+            except OSError as e:
+                logging.error(f"Could not delete file {entry.path}: {e}")
     logging.info(f"Deleted {deleted_count} file(s).")
 
 
@@ -100,45 +131,102 @@ def _generate_filenames(base_name: str, prefix: str, count: int):
         yield f"{base_name}.jsonl"
         return
 
-    for i in range(1, count + 1):
-        if prefix == "count":
+    if prefix == "count":
+        for i in range(1, count + 1):
             yield f"{base_name}_{i}.jsonl"
-        elif prefix == "random":
-            yield f"{base_name}_{random.randint(10000, 99999)}.jsonl"  # noqa: S311
-        elif prefix == "uuid":
-            yield f"{base_name}_{uuid4().hex[:8]}.jsonl"
+    elif prefix == "random":
+        randrange = random.Random().randrange  # noqa: S311
+        for _ in range(count):
+            yield f"{base_name}_{randrange(10000, 100000)}.jsonl"
+    elif prefix == "uuid":
+        # A single urandom call supplies the 8 hex characters of every file name
+        entropy = os.urandom(4 * count).hex()
+        for start in range(0, len(entropy), 8):
+            yield f"{base_name}_{entropy[start:start + 8]}.jsonl"
+
+
+def _iter_chunks(results_iter: Iterator[dict], size: int) -> Iterator[list[dict]]:
+    """A generator that yields consecutive lists of up to size records from results_iter."""
+    while chunk := list(islice(results_iter, size)):
+        yield chunk
+
+
+def _write_one_file(file_path: Path, chunk: list[dict]) -> bool:
+    """Encodes one chunk as JSONL and writes it to file_path. Returns True on success."""
+    try:
+        # Encode the whole chunk into one buffer so each file costs a single write. The buffer
+        # is per call on purpose: bytearray.clear() frees its storage, so a shared one saves
+        # nothing and would have to be guarded when files are written from several threads.
+        payload = bytearray()
+        for item in chunk:
+            try:
+                payload += _json_dumps(item)
+            except TypeError:
+                # orjson only encodes 64-bit integers; the stdlib encoder has no such limit
+                payload += json.dumps(item).encode()
+            payload += b"\n"
+        # A raw fd skips the FileIO/BufferedWriter objects that open() builds for every file
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            # os.write may write less than asked for, so loop over a zero-copy view
+            with memoryview(payload) as view:
+                written = 0
+                while written < len(view):
+                    written += os.write(fd, view[written:])
+        finally:
+            os.close(fd)
+
+        logging.debug(f"Saved {len(chunk)} lines to {file_path}")
+        return True
+    except OSError as e:
+        logging.error(f"Failed to write to file {file_path}: {e}")
+        return False
 
 
 def save_results_to_files(
-    results: list[dict], file_count: int, data_lines: int, save_path: Path, file_name: str, prefix: str
+    results: Iterable[dict],
+    file_count: int,
+    data_lines: int,
+    save_path: Path,
+    file_name: str,
+    prefix: str,
+    num_workers: int = 1,
 ) -> None:
-    """Saves the generated data into a specific number of files."""
-    if not results:
+    """
+    Saves the generated data into a specific number of files, using threads if num_workers > 1.
+    Results are consumed one file's worth at a time, so a generator is never fully materialized.
+    """
+    if data_lines <= 0:
+        logging.warning("No data was generated, nothing to save.")
+        return
+
+    results_iter = iter(results)
+    first_chunk = list(islice(results_iter, data_lines))
+    if not first_chunk:
         logging.warning("No data was generated, nothing to save.")
         return
 
     filename_gen = _generate_filenames(file_name, prefix, file_count)
+    # Group the flat stream of results into chunks, one for each file
+    chunks = chain([first_chunk], _iter_chunks(results_iter, data_lines))
+    jobs = ((save_path / name, chunk) for name, chunk in zip(filename_gen, chunks))
 
     saved_count = 0
-    # Group the flat list of results into chunks, one for each file
-    for i in range(0, len(results), data_lines):
-        file_end = i + data_lines
-        chunk = results[i:file_end]
-
-        try:
-            file_path = save_path / next(filename_gen)
-        except StopIteration:
-            logging.warning("Generated more data chunks than the specified file_count. Some data will not be saved.")
-            break
-
-        try:
-            with open(file_path, "w") as f:
-                for item in chunk:
-                    f.write(json.dumps(item) + "\n")
-
-                logging.debug(f"Saved {len(chunk)} lines to {file_path}")
-                saved_count += 1
-        except OSError as e:
-            logging.error(f"Failed to write to file {file_path}: {e}")
+    if num_workers <= 1:
+        for file_path, chunk in jobs:
+            saved_count += _write_one_file(file_path, chunk)
+    else:
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            pending = deque()
+            for file_path, chunk in jobs:
+                pending.append(executor.submit(_write_one_file, file_path, chunk))
+                # Bound the chunks held in memory while earlier files are still being written
+                if len(pending) > num_workers * 2:
+                    saved_count += pending.popleft().result()
+            while pending:
+                saved_count += pending.popleft().result()
+
+    if next(results_iter, None) is not None:
+        logging.warning("Generated more data chunks than the specified file_count. Some data will not be saved.")
 
     logging.info(f"Successfully saved data to {saved_count} file(s).")
@@ -1,3 +1,4 @@
+import pickle
 from unittest.mock import patch
 
 import pytest
@@ -84,15 +85,96 @@ def test_timestamp_generation_uses_time_time():
         assert result["event_time"] == mock_time
 
 
-def test_str_rand_uses_uuid4():
+def test_str_rand_uses_os_urandom():
     """
-    Verifies that when 'str:rand' is used, the generator internally
-    calls the 'uuid.uuid4()' function.
+    Verifies that when 'str:rand' is used, the generator formats 16 bytes
+    from 'os.urandom()' as a dashed, UUID-shaped hex string.
     """
     schema = {"user_id": "str:rand"}
     generator = DataGenerator(schema)
-    mock_uuid = "a-b-c-d"
+    mock_bytes = bytes(range(16))
 
-    with patch("uuid.uuid4", return_value=mock_uuid):
+    with patch("os.urandom", return_value=mock_bytes):
         result = generator._generate_one_file()
-        assert result["user_id"] == str(mock_uuid)
+        assert result["user_id"] == "00010203-0405-0607-0809-0a0b0c0d0e0f"
+
+
+def test_generated_record_keeps_schema_key_order():
+    """
+    Verifies that the compiled record builder emits every key in schema order,
+    including keys that are not valid Python identifiers.
+    """
+    schema = {"z-key": "str:a", "a key": "int:1", "'quoted'": "str:b"}
+    generator = DataGenerator(schema)
+
+    result = generator._generate_one_file()
+    assert list(result) == list(schema)
+    assert result == {"z-key": "a", "a key": 1, "'quoted'": "b"}
+
+
+def test_generate_data_with_multiple_workers():
+    """
+    Verifies that the generator survives being shipped to worker processes
+    and that every worker produces valid records.
+    """
+    schema = {"id": "str:rand", "age": "int:rand(18, 65)"}
+    generator = DataGenerator(schema)
+
+    results = generator.generate_data(num_data=20, num_workers=2)
+    assert len(results) == 20
+    assert all(18 <= item["age"] <= 65 for item in results)
+
+
+def test_workers_do_not_repeat_random_sequences():
+    """
+    Verifies that worker processes do not share a random state, which would
+    show up as the same values repeated across batches.
+    """
+    schema = {"value": "int:rand(0, 1000000000)"}
+    generator = DataGenerator(schema)
+
+    values = [item["value"] for item in generator.generate_data(num_data=400, num_workers=4)]
+    assert len(set(values)) > 390
+
+
+def test_timestamp_is_snapshot_once_per_generate_data_call():
+    """
+    Verifies that 'timestamp:' columns share one clock reading per
+    generate_data call, while 'timestamp:live' reads the clock per record.
+    """
+    schema = {"batch_time": "timestamp:", "event_time": "timestamp:live"}
+    generator = DataGenerator(schema)
+
+    with patch("time.time", side_effect=range(100, 200)):
+        results = generator.generate_data(num_data=3)
+
+    assert [item["batch_time"] for item in results] == [100, 100, 100]
+    assert [item["event_time"] for item in results] == [101, 102, 103]
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_generate_data_iter_yields_requested_count(num_workers):
+    """
+    Verifies that the streaming generator yields exactly num_data records,
+    whether they come from the current process or from worker processes.
+    """
+    generator = DataGenerator({"id": "int:rand(1, 10)"})
+
+    results = generator.generate_data_iter(num_data=25, num_workers=num_workers)
+    assert not isinstance(results, list)
+    assert sum(1 for _ in results) == 25
+
+
+def test_pickled_copies_do_not_share_list_draws():
+    """
+    Verifies that copies of a generator sent to worker processes draw their
+    own list values instead of replaying values pre-drawn by the parent.
+    """
+    generator = DataGenerator({"value": f"int:{list(range(1000))}"})
+    generator._generate_one_file()
+
+    copy_a = pickle.loads(pickle.dumps(generator))
+    copy_b = pickle.loads(pickle.dumps(generator))
+    values_a = [copy_a._generate_one_file()["value"] for _ in range(20)]
+    values_b = [copy_b._generate_one_file()["value"] for _ in range(20)]
+    assert values_a != values_b
@@ -8,6 +8,14 @@ import pytest
 import main as main_script
 
 
+@pytest.fixture(autouse=True)
+def clear_generator_cache():
+    """Keeps generators cached by one test (possibly mocks) from leaking into the next."""
+    main_script._get_generator.cache_clear()
+    yield
+    main_script._get_generator.cache_clear()
+
+
 @pytest.fixture
 def default_args(tmp_path):
     """A pytest fixture to provide a default, valid set of arguments."""
@@ -27,7 +35,7 @@ def default_args(tmp_path):
 def test_main_calls_generator_with_correct_worker_count(default_args):
     """
     Tests that the 'workers' argument from the command line is correctly
-    passed to the DataGenerator's generate_data method.
+    passed to the DataGenerator's generate_data_iter method.
     """
     default_args.workers = 4
     with (
@@ -41,8 +49,8 @@ def test_main_calls_generator_with_correct_worker_count(default_args):
         mock_generator_instance.is_valid = True
         main_script.main(default_args)
 
-        mock_generator_instance.generate_data.assert_called()
-        call_args, call_kwargs = mock_generator_instance.generate_data.call_args
+        mock_generator_instance.generate_data_iter.assert_called()
+        call_args, call_kwargs = mock_generator_instance.generate_data_iter.call_args
         assert call_kwargs.get("num_workers") == 4
 
 
@@ -80,7 +88,7 @@ def test_main_calls_save_results_with_correct_args(default_args):
     ):
         mock_generator_instance = mock_generator_class.return_value
         mock_generator_instance.is_valid = True
-        mock_generator_instance.generate_data.return_value = mock_generated_data
+        mock_generator_instance.generate_data_iter.return_value = mock_generated_data
 
         main_script.main(default_args)
 
@@ -91,6 +99,7 @@ def test_main_calls_save_results_with_correct_args(default_args):
             save_path=expected_path_obj,
             file_name=default_args.file_name,
             prefix=default_args.prefix,
+            num_workers=default_args.workers,
         )
 
 
@@ -126,3 +135,22 @@ def test_main_exits_if_path_is_invalid(default_args):
         with pytest.raises(SystemExit) as e:
             main_script.main(default_args)
         assert e.type is SystemExit
+
+
+def test_main_reuses_generator_for_identical_schema(default_args):
+    """
+    Tests that running main twice with the same schema compiles the
+    DataGenerator only once.
+    """
+    with (
+        patch("main.validate_save_path", return_value=Path(default_args.path_to_save_files)),
+        patch("main.load_data_schema", side_effect=lambda _: {"id": "int:rand(1,10)"}),
+        patch("main.DataGenerator") as mock_generator_class,
+        patch("main.save_results_to_files"),
+        patch("sys.exit"),
+    ):
+        mock_generator_class.return_value.is_valid = True
+        main_script.main(default_args)
+        main_script.main(default_args)
+
+        mock_generator_class.assert_called_once_with({"id": "int:rand(1,10)"})
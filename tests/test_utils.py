@@ -1,5 +1,6 @@
 import json
 import re
+from unittest.mock import patch
 
 import pytest
 
@@ -122,3 +123,89 @@ def test_generate_filenames(prefix, count, expected_pattern):
     assert len(filenames) == count
     for fname in filenames:
         assert re.match(expected_pattern, fname)
+
+
+def test_save_multiple_files_with_workers(tmp_path):
+    """
+    Tests that writing files from a thread pool produces the same files and
+    contents as the sequential path.
+    """
+    results_data = [{"id": i} for i in range(12)]
+    file_name = "threaded_test"
+
+    save_results_to_files(
+        results=results_data,
+        file_count=4,
+        data_lines=3,
+        save_path=tmp_path,
+        file_name=file_name,
+        prefix="count",
+        num_workers=3,
+    )
+    for file_index in range(4):
+        lines = (tmp_path / f"{file_name}_{file_index + 1}.jsonl").read_text().strip().split("\n")
+        assert [json.loads(line) for line in lines] == results_data[file_index * 3 : file_index * 3 + 3]
+
+
+def test_load_data_schema_from_string_skips_path_lookup():
+    """Tests that an input that is clearly inline JSON never touches the filesystem."""
+    schema_string = '  {"product_id": "str:rand"}'
+    with patch("src.utils.read_from_path") as mock_read_from_path:
+        loaded_schema = load_data_schema(schema_string)
+    mock_read_from_path.assert_not_called()
+    assert loaded_schema == {"product_id": "str:rand"}
+
+
+def test_save_results_from_generator(tmp_path):
+    """
+    Tests that results can be streamed from a generator and that records
+    beyond file_count * data_lines are not written.
+    """
+    file_name = "stream_test"
+
+    save_results_to_files(
+        results=({"id": i} for i in range(7)),
+        file_count=3,
+        data_lines=2,
+        save_path=tmp_path,
+        file_name=file_name,
+        prefix="count",
+    )
+    created_files = sorted(tmp_path.glob(f"{file_name}_*.jsonl"))
+    assert len(created_files) == 3
+    lines = (tmp_path / f"{file_name}_3.jsonl").read_text().strip().split("\n")
+    assert [json.loads(line) for line in lines] == [{"id": 4}, {"id": 5}]
+
+
+def test_save_results_with_oversized_int(tmp_path):
+    """
+    Tests that integers outside the 64-bit range, which the schema allows,
+    are still written correctly.
+    """
+    file_name = "big_int_test"
+    big_value = 99999999999999999999999
+
+    save_results_to_files(
+        results=[{"a": big_value}, {"a": 1}],
+        file_count=1,
+        data_lines=2,
+        save_path=tmp_path,
+        file_name=file_name,
+        prefix="count",
+    )
+    lines = (tmp_path / f"{file_name}.jsonl").read_text().strip().split("\n")
+    assert [json.loads(line) for line in lines] == [{"a": big_value}, {"a": 1}]
+
+
+@pytest.mark.parametrize("data_lines", [0, -1])
+def test_save_results_with_non_positive_data_lines(tmp_path, data_lines):
+    """Tests that a non-positive data_lines saves nothing instead of raising."""
+    save_results_to_files(
+        results=[{"id": 1}],
+        file_count=2,
+        data_lines=data_lines,
+        save_path=tmp_path,
+        file_name="no_lines_test",
+        prefix="count",
+    )
+    assert list(tmp_path.iterdir()) == []